@@ -1,23 +1,151 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file
+from flask.json.provider import JSONProvider
+from werkzeug.datastructures import Headers
 from werkzeug.utils import secure_filename
+import orjson
 import os
-from missing_data_cleaner import MissingDataCleaner
+from missing_data_cleaner import MissingDataCleaner, evict_cached_data
+import shutil
 import tempfile
+import unicodedata
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 import uuid
-import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; previews are then always sent as JSON
+    pa = None
+
+ARROW_STREAM_MIMETYPE = 'application/vnd.apache.arrow.stream'
+PARQUET_MIMETYPE = 'application/vnd.apache.parquet'
+
+
+def _orjson_default(obj):
+    """Fallback for values orjson can't serialize natively (e.g. NaT)"""
+    if pd.api.types.is_scalar(obj) and pd.isna(obj):
+        return None
+    return str(obj)
+
+
+class OrJSONProvider(JSONProvider):
+    """JSON provider backed by orjson; numpy scalars and NaN (as null) are handled natively"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, default=_orjson_default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrJSONProvider(app)
 app.config['UPLOAD_FOLDER'] = tempfile.gettempdir()
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB limit
 app.config['SECRET_KEY'] = str(uuid.uuid4())
 
+# Let a fronting server stream downloads from disk instead of the Python worker:
+# X-Sendfile for Apache/lighttpd, X-Accel-Redirect (internal location prefix) for nginx
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'
+app.config['X_ACCEL_REDIRECT_PREFIX'] = os.environ.get('X_ACCEL_REDIRECT_PREFIX')
+
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls', 'json'}
 
+# Formats /clean can write on request; by default it keeps the upload's format
+OUTPUT_FORMATS = {'parquet', 'csv', 'xlsx', 'json'}
+
+# Buffer size for copying uploads to disk
+UPLOAD_COPY_BUFFER = 1 << 20
+
+# Threads used by /cleanup to remove files concurrently
+CLEANUP_WORKERS = 16
+
+DOWNLOAD_MIMETYPES = {
+    '.parquet': PARQUET_MIMETYPE,
+    '.csv': 'text/csv',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.json': 'application/json',
+}
+
 def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def arrow_preview(preview_df, payload):
+    """
+    Encode a preview frame as an Arrow IPC stream
+
+    The remaining response fields travel as JSON in the schema metadata
+    under 'payload'. Returns None if the frame can't be converted.
+    """
+    try:
+        batch = pa.RecordBatch.from_pandas(preview_df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    batch = batch.replace_schema_metadata({'payload': app.json.dumps(payload)})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+def preview_response(preview_df, **payload):
+    """Respond with the preview as Arrow IPC if the client prefers it, else as JSON records"""
+    best = request.accept_mimetypes.best_match(['application/json', ARROW_STREAM_MIMETYPE])
+    if pa is not None and best == ARROW_STREAM_MIMETYPE:
+        body = arrow_preview(preview_df, payload)
+        if body is not None:
+            return Response(body, mimetype=ARROW_STREAM_MIMETYPE)
+    
+    return jsonify({**payload, 'preview': preview_df.to_dict(orient='records')})
+
+def requested_output_format(data):
+    """
+    Output format asked for by a /clean request, or None to keep the upload's format
+
+    An explicit 'format' field wins; otherwise Parquet is chosen when pyarrow
+    is installed and the Accept header names the Parquet media type itself.
+    """
+    if 'format' in data:
+        return data['format']
+    accepted = {mimetype for mimetype, quality in request.accept_mimetypes if quality}
+    if pa is not None and PARQUET_MIMETYPE in accepted:
+        return 'parquet'
+    return None
+
+def attachment_headers(filename):
+    """Content-Disposition for a download, encoded the same way send_file does it"""
+    try:
+        filename.encode('ascii')
+    except UnicodeEncodeError:
+        # ASCII fallback for old clients plus the RFC 5987 UTF-8 name
+        simple = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+        names = {'filename': simple, 'filename*': f"UTF-8''{quote(filename, safe='!#$&+^`|~')}"}
+    else:
+        names = {'filename': filename}
+    
+    headers = Headers()
+    headers.set('Content-Disposition', 'attachment', **names)
+    return headers
+
+def save_upload(file, filepath):
+    """Copy an uploaded file's (already spooled) stream to disk in 1 MB chunks"""
+    with open(filepath, 'wb', buffering=UPLOAD_COPY_BUFFER) as out:
+        shutil.copyfileobj(file.stream, out, length=UPLOAD_COPY_BUFFER)
+
+def remove_upload(filename):
+    """Delete a file from the upload folder, ignoring files that are already gone"""
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
+    # Free this worker's parse of the file; other workers' copies age out of
+    # their caches and are never served since the file's mtime can't be read
+    evict_cached_data(filepath)
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -34,28 +162,19 @@ def upload_file():
     if file and allowed_file(file.filename):
         filename = secure_filename(file.filename)
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        save_upload(file, filepath)
         
+        # Only parse the first rows here; /analyze does the full parse
         cleaner = MissingDataCleaner(filepath)
-        if not cleaner.load_data():
+        preview_df = cleaner.load_preview(n=10)
+        if preview_df is None:
             return jsonify({'error': 'Error loading file'}), 400
         
-        # Get file info and stats
-        missing_counts = cleaner.analyze_missing_data()
-        column_stats = cleaner.get_column_stats()
-        
-        # Sample data for preview
-        preview_data = cleaner.df.head(10).replace({np.nan: None}).to_dict(orient='records')
-        columns = list(cleaner.df.columns)
-        
-        return jsonify({
-            'filename': filename,
-            'preview': preview_data,
-            'columns': columns,
-            'missing_counts': missing_counts,
-            'column_stats': column_stats,
-            'shape': {'rows': cleaner.df.shape[0], 'cols': cleaner.df.shape[1]}
-        })
+        return preview_response(
+            preview_df,
+            filename=filename,
+            columns=list(preview_df.columns)
+        )
     
     return jsonify({'error': 'Invalid file type'}), 400
 
@@ -79,13 +198,13 @@ def analyze_data():
     column_stats = cleaner.get_column_stats()
     knn_recommendation = cleaner.get_knn_recommendation()
     
-    return jsonify({
-        'missing_counts': missing_counts,
-        'column_stats': column_stats,
-        'knn_recommendation': knn_recommendation,
-        'preview': cleaner.df.head(10).replace({np.nan: None}).to_dict(orient='records'),
-        'columns': list(cleaner.df.columns)
-    })
+    return preview_response(
+        cleaner.df.head(10),
+        missing_counts=missing_counts,
+        column_stats=column_stats,
+        knn_recommendation=knn_recommendation,
+        columns=list(cleaner.df.columns)
+    )
 
 @app.route('/clean', methods=['POST'])
 def clean_data():
@@ -94,6 +213,12 @@ def clean_data():
     if not data or 'filename' not in data or 'method' not in data:
         return jsonify({'error': 'Invalid request'}), 400
     
+    output_format = requested_output_format(data)
+    if output_format is not None and output_format not in OUTPUT_FORMATS:
+        return jsonify({'error': 'Unsupported output format'}), 400
+    if output_format == 'parquet' and pa is None:
+        return jsonify({'error': 'Parquet output requires pyarrow'}), 400
+    
     filepath = os.path.join(app.config['UPLOAD_FOLDER'], data['filename'])
     if not os.path.exists(filepath):
         return jsonify({'error': 'File not found'}), 404
@@ -113,15 +238,19 @@ def clean_data():
             cleaner.clean_data(method=method, columns=columns, **params)
         
         # Save and return results
-        output_filename = f"cleaned_{data['filename']}"
+        if output_format is None:
+            output_filename = f"cleaned_{data['filename']}"
+        else:
+            stem = os.path.splitext(data['filename'])[0]
+            output_filename = f"cleaned_{stem}.{output_format}"
         output_path = os.path.join(app.config['UPLOAD_FOLDER'], output_filename)
         cleaner.save_cleaned_data(output_path)
         
-        return jsonify({
-            'success': True,
-            'cleaned_filename': output_filename,
-            'preview': cleaner.cleaned_df.head(10).replace({np.nan: None}).to_dict(orient='records')
-        })
+        return preview_response(
+            cleaner.cleaned_df.head(10),
+            success=True,
+            cleaned_filename=output_filename
+        )
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -131,11 +260,20 @@ def download_file(filename):
     if not os.path.exists(filepath):
         return jsonify({'error': 'File not found'}), 404
     
+    ext = os.path.splitext(filename)[1].lower()
+    mimetype = DOWNLOAD_MIMETYPES.get(ext, 'application/octet-stream')
+    
+    accel_prefix = app.config['X_ACCEL_REDIRECT_PREFIX']
+    if accel_prefix:
+        headers = attachment_headers(filename)
+        headers['X-Accel-Redirect'] = f"{accel_prefix.rstrip('/')}/{quote(filename)}"
+        return Response(headers=headers, mimetype=mimetype)
+    
     return send_file(
         filepath,
         as_attachment=True,
         download_name=filename,
-        mimetype='application/octet-stream'
+        mimetype=mimetype
     )
 
 @app.route('/cleanup', methods=['POST'])
@@ -144,13 +282,9 @@ def cleanup_files():
     if not data or 'filenames' not in data:
         return jsonify({'error': 'Invalid request'}), 400
     
-    for filename in data['filenames']:
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        if os.path.exists(filepath):
-            try:
-                os.remove(filepath)
-            except:
-                pass
+    # Unlinks are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        list(executor.map(remove_upload, data['filenames']))
     
     return jsonify({'message': 'Cleanup complete'})
 
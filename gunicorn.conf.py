@@ -0,0 +1,25 @@
+# Gunicorn settings for production deployment: gunicorn app_app:app
+import multiprocessing
+import os
+
+bind = '0.0.0.0:8000'
+
+# Request work is CPU-bound (parsing, stats, imputation), so run one
+# single-threaded worker process per core rather than the I/O-bound 2*cpu+1
+workers = multiprocessing.cpu_count()
+threads = 1
+
+# Keep each worker's BLAS pool (numpy/sklearn imputation) to one thread so
+# workers don't oversubscribe cores. Set here, before workers fork and import
+# the app. OMP_NUM_THREADS is deliberately left alone: pyarrow sizes its CPU
+# pool from it, and capping it would make the CSV parse single-threaded.
+for var in ('OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+    os.environ.setdefault(var, '1')
+
+# Note: the parsed-DataFrame cache (missing_data_cleaner._load_df) lives in
+# each worker process. Consecutive /upload, /analyze and /clean calls only
+# reuse it when they land on the same worker, and memory use grows with the
+# worker count (up to DATA_CACHE_MAX_BYTES of frames each).
+
+# KNN/iterative imputation on large uploads can exceed the 30s default
+timeout = 300
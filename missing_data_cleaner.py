@@ -1,9 +1,353 @@
 import pandas as pd
 import numpy as np
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
 from sklearn.experimental import enable_iterative_imputer
 from sklearn.impute import IterativeImputer, KNNImputer
-from typing import Union, Dict, Optional, List
+from typing import Callable, Union, Dict, Optional, List, Tuple
+
+# Shallow copies share column data until one side writes to it, so the
+# cached frames can be handed out for cleaning without duplicating them
+pd.set_option('mode.copy_on_write', True)
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to the pandas C parser
+    pa = pacsv = None
+
+try:
+    import faiss
+except ImportError:  # faiss is optional; fall back to sklearn's KNNImputer
+    faiss = None
+
+try:
+    from cuml.neighbors import NearestNeighbors as CumlNearestNeighbors
+    HAVE_CUML = True
+except ImportError:  # cuML needs a CUDA device; CPU backends are used otherwise
+    HAVE_CUML = False
+
+# Below this many rows the host-to-GPU transfer outweighs the speedup
+GPU_MIN_ROWS = 5000
+
+# Neighbor-search passes in the FAISS/cuML KNN imputation; each pass after the
+# first measures distances with the previous pass's estimates instead of means
+KNN_REFINE_PASSES = 2
+
+# Non-numeric columns report no mode in column stats when they have more than
+# MODE_MAX_UNIQUE distinct values and those make up more than MODE_MAX_DISTINCT_RATIO
+# of their non-null rows
+MODE_MAX_UNIQUE = 10_000
+MODE_MAX_DISTINCT_RATIO = 0.9
+
+# Above this many numeric cells the recommended KNN neighbor count is scaled down
+KNN_WORK_LIMIT = 10 ** 7
+
+# Rough per-core distance throughput used for KNN run-time estimates
+KNN_DISTANCE_OPS_PER_SECOND = 1e9
+
+# Object columns with fewer distinct values than this fraction of rows are stored as categoricals
+CATEGORICAL_MAX_RATIO = 0.5
+
+# In-memory size budget for parsed DataFrames kept by each process
+DATA_CACHE_MAX_BYTES = 256 << 20
+
+
+def _pandas_column_names(names: List[str]) -> List[str]:
+    """
+    Rename blank and duplicate header names the way pd.read_csv does
+    
+    Blank names become 'Unnamed: <i>' and repeats get '.1', '.2', ...
+    suffixes, so pyarrow-parsed frames match the pandas preview.
+    """
+    names = [name if name else f"Unnamed: {i}" for i, name in enumerate(names)]
+    original = set(names)
+    counts: Dict[str, int] = {}
+    for i, name in enumerate(names):
+        base = name
+        count = counts.get(base, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            # Skip suffixes that collide with a header already in the file
+            count = count + 1 if name in original else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def _read_csv(file_path: str, nrows: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow's multi-threaded reader when available
+    
+    With nrows, only the blocks holding the first nrows rows are parsed, by
+    the same reader and type inference as the full read, so previews get
+    the same column names and dtypes.
+    """
+    if pacsv is not None:
+        read_options = pacsv.ReadOptions(block_size=8 << 20, use_threads=True)
+        convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+        # Memory-map the file so the tokenizer reads straight from the page cache
+        with pa.memory_map(file_path, 'r') as source:
+            if nrows is None:
+                table = pacsv.read_csv(
+                    source, read_options=read_options, convert_options=convert_options
+                )
+            else:
+                reader = pacsv.open_csv(
+                    source, read_options=read_options, convert_options=convert_options
+                )
+                batches = []
+                for batch in reader:
+                    batches.append(batch)
+                    if sum(b.num_rows for b in batches) >= nrows:
+                        break
+                table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+        table = table.rename_columns(_pandas_column_names(table.column_names))
+        return table.to_pandas()
+    return pd.read_csv(file_path, engine='c', low_memory=False, cache_dates=True, nrows=nrows)
+
+
+def _read_xlsx(file_path: str) -> pd.DataFrame:
+    """Read an .xlsx workbook (openpyxl opens it in read-only streaming mode)"""
+    return pd.read_excel(file_path, engine='openpyxl')
+
+
+# Full-file parser per (lower-cased) extension
+LOADERS: Dict[str, Callable[[str], pd.DataFrame]] = {
+    '.csv': _read_csv,
+    '.xlsx': _read_xlsx,
+    '.xls': pd.read_excel,
+    '.json': pd.read_json,
+}
+
+
+def _file_ext(file_path: str) -> str:
+    """Lower-cased extension of a path, e.g. '.csv'"""
+    return os.path.splitext(file_path)[1].lower()
+
+
+LoadedData = Tuple[pd.DataFrame, List[str], pd.Series]
+
+# file path -> (mtime, size in bytes, parsed data), least recently used first
+_data_cache: 'OrderedDict[str, Tuple[float, int, LoadedData]]' = OrderedDict()
+_data_cache_lock = threading.Lock()
+
+
+def _parse_file(file_path: str) -> LoadedData:
+    """Parse a data file into its DataFrame, numeric columns and null counts"""
+    loader = LOADERS.get(_file_ext(file_path))
+    if loader is None:
+        raise ValueError("Unsupported file format")
+    df = loader(file_path)
+
+    # Low-cardinality string columns become categoricals so later
+    # nunique/mode/fillna passes work on integer codes. All-null columns
+    # stay object rather than becoming a categorical with no categories.
+    for col in df.select_dtypes(include='object').columns:
+        unique = df[col].nunique(dropna=True)
+        if 0 < unique < CATEGORICAL_MAX_RATIO * len(df):
+            df[col] = df[col].astype('category')
+
+    # Identify numeric columns for imputation methods
+    numeric_columns = df.select_dtypes(include=np.number).columns.tolist()
+    
+    # Per-column missing counts, shared by every analysis/cleaning method
+    null_counts = df.isna().sum()
+    return df, numeric_columns, null_counts
+
+
+def _load_df(file_path: str) -> LoadedData:
+    """
+    Parse a data file, reusing this process's previous parse while its mtime is unchanged
+    
+    Entries are keyed by path, so a re-uploaded file replaces its old parse.
+    The least recently used frames are evicted once the cache holds more
+    than DATA_CACHE_MAX_BYTES; a frame larger than that is never cached.
+    """
+    mtime = os.path.getmtime(file_path)
+    with _data_cache_lock:
+        entry = _data_cache.get(file_path)
+        if entry is not None and entry[0] == mtime:
+            _data_cache.move_to_end(file_path)
+            return entry[2]
+    
+    data = _parse_file(file_path)
+    size = int(data[0].memory_usage(index=True, deep=True).sum())
+    with _data_cache_lock:
+        _data_cache.pop(file_path, None)
+        if size <= DATA_CACHE_MAX_BYTES:
+            _data_cache[file_path] = (mtime, size, data)
+            while sum(cached[1] for cached in _data_cache.values()) > DATA_CACHE_MAX_BYTES:
+                _data_cache.popitem(last=False)
+    return data
+
+
+def _faiss_search(vectors: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """Exact L2 nearest-neighbor search on the CPU with FAISS"""
+    index = faiss.IndexFlatL2(vectors.shape[1])
+    index.add(vectors)
+    _, neighbors = index.search(queries, k)
+    return neighbors
+
+
+def _cuml_search(vectors: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """
+    Exact L2 nearest-neighbor search on the GPU with cuML
+    
+    Each call copies vectors to the device and fits a new index, so callers
+    should batch all their queries against one set of vectors into one call.
+    """
+    nn = CumlNearestNeighbors(n_neighbors=k)
+    nn.fit(vectors)
+    _, neighbors = nn.kneighbors(queries)
+    return np.asarray(neighbors)
+
+
+def _knn_impute(
+    X: np.ndarray,
+    n_neighbors: int,
+    search: Callable[[np.ndarray, np.ndarray, int], np.ndarray],
+    passes: int = KNN_REFINE_PASSES
+) -> np.ndarray:
+    """
+    Impute NaNs in a numeric matrix from the mean of each row's nearest neighbors
+    
+    Every column with missing values gets one search per pass: the rows
+    missing it query an index of the rows that have it, over all columns
+    except the target (zeroed on both sides). Other missing cells start at
+    the column mean and are replaced by the previous pass's estimates, which
+    brings the result close to sklearn's nan-euclidean KNNImputer. Only
+    originally missing cells are overwritten; columns with no observed
+    values keep the fill of 0.
+    """
+    mask = np.isnan(X)
+    missing_cols = np.flatnonzero(mask.any(axis=0))
+    if missing_cols.size == 0:
+        return X
+    
+    col_means = np.nan_to_num(np.nanmean(X, axis=0))
+    filled = np.where(mask, col_means, X).astype(np.float32)
+    for _ in range(passes):
+        estimates = filled.copy()
+        for col in missing_cols:
+            rows = np.flatnonzero(mask[:, col])
+            donors = np.flatnonzero(~mask[:, col])
+            if donors.size == 0:
+                continue
+            
+            # Hide the target column from the distance; fancy indexing copies
+            target = filled[:, col].copy()
+            filled[:, col] = 0
+            vectors, queries = filled[donors], filled[rows]
+            filled[:, col] = target
+            
+            neighbors = search(vectors, queries, min(n_neighbors, donors.size))
+            estimates[rows, col] = X[donors[neighbors], col].mean(axis=1)
+        filled = estimates
+    return filled
+
+
+def _column_modes(df: pd.DataFrame) -> pd.Series:
+    """Most frequent value of every column (NaN for columns with no values)"""
+    modes = df.mode()
+    if not len(modes):
+        return pd.Series(np.nan, index=df.columns, dtype=object)
+    return modes.iloc[0]
+
+
+def _impute_numeric(
+    df: pd.DataFrame,
+    numeric_columns: List[str],
+    impute: Callable[[np.ndarray], np.ndarray]
+) -> None:
+    """
+    Run an imputer over the numeric block in float32 and fill the results into df
+    
+    Only missing cells are written back, so observed values keep their
+    original precision and integer columns without NaNs keep their dtype.
+    """
+    block = df[numeric_columns]
+    X = block.to_numpy(dtype=np.float32)
+    imputed = pd.DataFrame(impute(X), index=block.index, columns=numeric_columns)
+    df[numeric_columns] = block.fillna(imputed)
+
+
+CleaningPlan = Callable[[pd.DataFrame, pd.Series], pd.DataFrame]
+
+
+@lru_cache(maxsize=128)
+def _make_cleaner(
+    dtype_key: Tuple[str, ...],
+    numeric_key: Tuple[str, ...],
+    method: str,
+    cols_key: Tuple[str, ...],
+    max_iter: int = 10,
+    threshold: float = 0.5
+) -> CleaningPlan:
+    """
+    Build a cleaning function for one (schema, method, columns) combination
+    
+    All method dispatch and column selection happens here, once per key; the
+    returned plan takes the frame to clean plus its per-column null fractions
+    and only runs the vectorized pandas ops. dtype_key is part of the cache
+    key so a schema change always gets a fresh plan.
+    """
+    cols = list(cols_key)
+    numeric_cols = list(numeric_key)
+    
+    # Each plan fills every selected column in one vectorized call
+    if method in ('mean', 'median'):
+        fill_cols = [col for col in cols if col in numeric_key]
+        if not fill_cols:
+            return lambda df, null_frac: df
+        
+        def plan(df, null_frac):
+            df[fill_cols] = df[fill_cols].fillna(getattr(df[fill_cols], method)())
+            return df
+    elif method == 'mode':
+        def plan(df, null_frac):
+            df[cols] = df[cols].fillna(_column_modes(df[cols]))
+            return df
+    elif method == 'iterative':
+        def plan(df, null_frac):
+            imputer = IterativeImputer(max_iter=max_iter, random_state=0)
+            _impute_numeric(df, numeric_cols, imputer.fit_transform)
+            return df
+    elif method in ('ffill', 'bfill'):
+        def plan(df, null_frac):
+            df[cols] = getattr(df[cols], method)()
+            return df
+    elif method == 'drop':
+        def plan(df, null_frac):
+            col_frac = null_frac[cols]
+            to_drop = col_frac[col_frac > threshold].index
+            df.drop(columns=to_drop, inplace=True)
+            df.dropna(subset=[col for col in cols if col not in to_drop], inplace=True)
+            return df
+    else:
+        return lambda df, null_frac: df
+    
+    return plan
+
+
+def _stringify_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast object/category columns holding mixed value types to str, keeping NaN"""
+    df = df.copy(deep=False)
+    for col in df.select_dtypes(include=['object', 'category']).columns:
+        values = df[col].astype(object)
+        if pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+            df[col] = values.where(values.isna(), values.astype(str))
+    return df
+
+
+def evict_cached_data(file_path: str) -> None:
+    """Drop this process's cached parse of a file (e.g. after it is removed)"""
+    with _data_cache_lock:
+        _data_cache.pop(file_path, None)
+
 
 class MissingDataCleaner:
     """Enhanced missing data cleaner with multiple imputation methods"""
@@ -15,50 +359,83 @@ class MissingDataCleaner:
         self.cleaned_df = None
         self.missing_counts = None
         self.numeric_columns = None
+        self._null_counts = None
+        self._null_frac = None
         
     def load_data(self) -> bool:
-        """Load data from various file formats"""
+        """Load data from various file formats (cached per file path and mtime)"""
         try:
-            if self.file_path.endswith('.csv'):
-                self.df = pd.read_csv(self.file_path)
-            elif self.file_path.endswith(('.xlsx', '.xls')):
-                self.df = pd.read_excel(self.file_path)
-            elif self.file_path.endswith('.json'):
-                self.df = pd.read_json(self.file_path)
-            else:
-                raise ValueError("Unsupported file format")
-            
-            # Identify numeric columns for imputation methods
-            self.numeric_columns = self.df.select_dtypes(include=np.number).columns.tolist()
+            self.df, numeric_columns, self._null_counts = _load_df(self.file_path)
+            self.numeric_columns = list(numeric_columns)
+            self._null_frac = self._null_counts / max(1, len(self.df))
             return True
         except Exception as e:
             print(f"Error loading file: {e}")
             return False
     
+    def load_preview(self, n: int = 10) -> Optional[pd.DataFrame]:
+        """Read only the first n rows of the file for a quick preview"""
+        try:
+            ext = _file_ext(self.file_path)
+            if ext == '.csv':
+                return _read_csv(self.file_path, nrows=n)
+            elif ext in ('.xlsx', '.xls'):
+                return pd.read_excel(self.file_path, nrows=n)
+            elif ext == '.json':
+                # Plain JSON documents can't be read partially; reuse the cached full parse
+                df = _load_df(self.file_path)[0]
+                return df.head(n)
+            else:
+                raise ValueError("Unsupported file format")
+        except Exception as e:
+            print(f"Error loading file: {e}")
+            return None
+    
     def analyze_missing_data(self) -> Dict[str, int]:
         """Analyze and return missing data statistics"""
         if self.df is None:
             return {}
             
-        self.missing_counts = self.df.isnull().sum().to_dict()
+        self.missing_counts = self._null_counts.to_dict()
         return self.missing_counts
     
-    def apply_knn_imputation(self, n_neighbors: int = 5) -> pd.DataFrame:
+    def apply_knn_imputation(
+        self,
+        n_neighbors: int = 5,
+        use_gpu: bool = False,
+        use_faiss: bool = False
+    ) -> pd.DataFrame:
         """
         Apply KNN imputation to numeric columns
         
+        sklearn's KNNImputer is used unless a faster backend is requested.
+        
         Args:
             n_neighbors: Number of neighbors to use for imputation
+            use_gpu: Run the neighbor search on the GPU via cuML for large frames
+                (one index fit per column with missing values per pass)
+            use_faiss: Run the neighbor search with FAISS on the CPU (faster on
+                large frames, slightly less accurate than KNNImputer on wide ones)
             
         Returns:
             DataFrame with missing values imputed
         """
         if not self.numeric_columns:
-            return self.df.copy()
+            return self.df.copy(deep=False)
             
-        imputer = KNNImputer(n_neighbors=n_neighbors)
-        df_imputed = self.df.copy()
-        df_imputed[self.numeric_columns] = imputer.fit_transform(df_imputed[self.numeric_columns])
+        df_imputed = self.df.copy(deep=False)
+        if use_gpu and HAVE_CUML and len(df_imputed) > GPU_MIN_ROWS:
+            search = _cuml_search
+        elif use_faiss and faiss is not None:
+            search = _faiss_search
+        else:
+            search = None
+        
+        if search is not None:
+            impute = partial(_knn_impute, n_neighbors=n_neighbors, search=search)
+        else:
+            impute = KNNImputer(n_neighbors=n_neighbors).fit_transform
+        _impute_numeric(df_imputed, self.numeric_columns, impute)
         return df_imputed
     
     def clean_data(
@@ -83,39 +460,23 @@ class MissingDataCleaner:
             
         if method == 'knn':
             n_neighbors = kwargs.get('n_neighbors', 5)
-            self.cleaned_df = self.apply_knn_imputation(n_neighbors=n_neighbors)
+            use_gpu = kwargs.get('use_gpu', False)
+            use_faiss = kwargs.get('use_faiss', False)
+            self.cleaned_df = self.apply_knn_imputation(
+                n_neighbors=n_neighbors, use_gpu=use_gpu, use_faiss=use_faiss
+            )
             return self.cleaned_df
             
-        df = self.df.copy()
-        columns = columns if columns else df.columns
-        
-        for col in columns:
-            if col not in df.columns:
-                continue
-                
-            if method == 'mean' and pd.api.types.is_numeric_dtype(df[col]):
-                fill_value = df[col].mean()
-                df[col].fillna(fill_value, inplace=True)
-            elif method == 'median' and pd.api.types.is_numeric_dtype(df[col]):
-                fill_value = df[col].median()
-                df[col].fillna(fill_value, inplace=True)
-            elif method == 'mode':
-                fill_value = df[col].mode()[0]
-                df[col].fillna(fill_value, inplace=True)
-            elif method == 'iterative':
-                max_iter = kwargs.get('max_iter', 10)
-                imputer = IterativeImputer(max_iter=max_iter, random_state=0)
-                df[self.numeric_columns] = imputer.fit_transform(df[self.numeric_columns])
-            elif method == 'ffill':
-                df[col].fillna(method='ffill', inplace=True)
-            elif method == 'bfill':
-                df[col].fillna(method='bfill', inplace=True)
-            elif method == 'drop':
-                threshold = kwargs.get('threshold', 0.5)
-                if df[col].isnull().mean() > threshold:
-                    df.drop(col, axis=1, inplace=True)
-                else:
-                    df.dropna(subset=[col], inplace=True)
+        columns = columns if columns else self.df.columns
+        plan = _make_cleaner(
+            tuple(map(str, self.df.dtypes)),
+            tuple(self.numeric_columns),
+            method,
+            tuple(col for col in columns if col in self.df.columns),
+            max_iter=kwargs.get('max_iter', 10),
+            threshold=kwargs.get('threshold', 0.5)
+        )
+        df = plan(self.df.copy(deep=False), self._null_frac)
         
         self.cleaned_df = df
         return df
@@ -131,9 +492,21 @@ class MissingDataCleaner:
             output_path = os.path.join(dir_name, f"{name}_cleaned{ext}")
         
         try:
-            if output_path.endswith('.csv'):
+            if output_path.endswith('.parquet'):
+                if pa is None:
+                    raise ValueError("Parquet output requires pyarrow")
+                try:
+                    self.cleaned_df.to_parquet(output_path, engine='pyarrow', compression='snappy', index=False)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    # Mixed-type columns (e.g. 1, 'A2', 3) have no Arrow type; store them as text
+                    _stringify_mixed_columns(self.cleaned_df).to_parquet(
+                        output_path, engine='pyarrow', compression='snappy', index=False
+                    )
+            elif output_path.endswith('.csv'):
                 self.cleaned_df.to_csv(output_path, index=False)
-            elif output_path.endswith(('.xlsx', '.xls')):
+            elif output_path.endswith('.xlsx'):
+                self.cleaned_df.to_excel(output_path, index=False, engine='xlsxwriter')
+            elif output_path.endswith('.xls'):
                 self.cleaned_df.to_excel(output_path, index=False)
             elif output_path.endswith('.json'):
                 self.cleaned_df.to_json(output_path, orient='records')
@@ -149,24 +522,54 @@ class MissingDataCleaner:
         if self.df is None:
             return {}
             
+        # One pass per statistic over the whole frame instead of per column
+        dtypes = self.df.dtypes.astype(str).to_dict()
+        missing = self._null_counts.to_dict()
+        unique = self.df.nunique(dropna=True).to_dict()
+        
+        numeric = set(self.numeric_columns or [])
+        numeric_df = self.df[list(numeric)]
+        desc = numeric_df.describe().to_dict() if numeric else {}
+        
+        # describe() upcasts everything to float; take min/max per dtype group
+        # so integer columns keep reporting integers
+        mins, maxs = {}, {}
+        for group in (numeric_df.select_dtypes(include='integer'),
+                      numeric_df.select_dtypes(exclude='integer')):
+            if group.shape[1]:
+                mins.update(group.min().to_dict())
+                maxs.update(group.max().to_dict())
+        
+        # A mode over (nearly) all-distinct values is meaningless, so skip the
+        # extra pass for large columns that are mostly unique
+        non_numeric = [
+            col for col in self.df.columns
+            if col not in numeric and (
+                unique[col] <= MODE_MAX_UNIQUE
+                or unique[col] <= MODE_MAX_DISTINCT_RATIO * (len(self.df) - missing[col])
+            )
+        ]
+        modes = _column_modes(self.df[non_numeric]).to_dict() if non_numeric else {}
+        
         stats = {}
         for col in self.df.columns:
             col_stats = {
-                'dtype': str(self.df[col].dtype),
-                'missing': self.df[col].isnull().sum(),
-                'unique': self.df[col].nunique(),
+                'dtype': dtypes[col],
+                'missing': missing[col],
+                'unique': unique[col],
             }
             
-            if pd.api.types.is_numeric_dtype(self.df[col]):
+            if col in numeric:
+                col_desc = desc[col]
                 col_stats.update({
-                    'mean': self.df[col].mean(),
-                    'median': self.df[col].median(),
-                    'min': self.df[col].min(),
-                    'max': self.df[col].max(),
-                    'std': self.df[col].std()
+                    'mean': col_desc['mean'],
+                    'median': col_desc['50%'],
+                    'min': mins[col],
+                    'max': maxs[col],
+                    'std': col_desc['std']
                 })
             else:
-                col_stats['mode'] = self.df[col].mode()[0]
+                col_stats['mode'] = modes.get(col, 'high-cardinality')
                 
             stats[col] = col_stats
             
@@ -177,7 +580,7 @@ class MissingDataCleaner:
         if not self.numeric_columns:
             return {'recommended': False, 'reason': 'No numeric columns found'}
             
-        missing_stats = {col: self.df[col].isnull().sum() for col in self.numeric_columns}
+        missing_stats = self._null_counts[self.numeric_columns].to_dict()
         total_missing = sum(missing_stats.values())
         
         if total_missing == 0:
@@ -187,9 +590,19 @@ class MissingDataCleaner:
         n_samples = len(self.df)
         recommended_neighbors = max(3, min(10, int(np.sqrt(n_samples))))
         
+        # Shrink k on very large frames to keep the neighbor search tractable
+        work = n_samples * len(self.numeric_columns)
+        if work > KNN_WORK_LIMIT:
+            recommended_neighbors = max(3, int(KNN_WORK_LIMIT / work * recommended_neighbors))
+        
+        # Each incomplete row is compared against every row; missing cells bound the row count
+        query_rows = min(n_samples, total_missing)
+        estimated_cost = query_rows * work / KNN_DISTANCE_OPS_PER_SECOND
+        
         return {
             'recommended': True,
             'n_neighbors': recommended_neighbors,
             'missing_stats': missing_stats,
-            'numeric_columns': self.numeric_columns
+            'numeric_columns': self.numeric_columns,
+            'estimated_cost_seconds': round(estimated_cost, 2)
         }
\ No newline at end of file